@@ -8,6 +8,7 @@ from google.genai.types import GenerateContentConfig
 
 from ..config import RETRY_CONFIG, MODEL_NAME
 from ..tools import update_career_goals
+from ..utils import analyze_timeline, format_timeline
 
 
 def career_context_injection(callback_context: CallbackContext, llm_request: LlmRequest):
@@ -31,10 +32,15 @@ def career_context_injection(callback_context: CallbackContext, llm_request: Llm
             skills_preview = ', '.join(job_history['skills'][:10])
             context_parts.append(f"\nKey Skills: {skills_preview}")
 
+        # Precomputed tenure/gap analytics so the model doesn't derive them
+        timeline_text = format_timeline(analyze_timeline(job_history))
+        if timeline_text:
+            context_parts.append(f"\nTimeline:\n{timeline_text}")
+
         # Prepend to the system instruction
         context_text = "\n".join(context_parts)
         injection = f"[CONTEXT - Candidate Background]\n{context_text}\n\n[END CONTEXT]\n\n"
-        llm_request.system_instruction = injection + (llm_request.system_instruction or "")
+        llm_request.config.system_instruction = injection + (llm_request.config.system_instruction or "")
 
 
 def create_career_interviewer():
@@ -2,10 +2,24 @@
 
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
 from google.genai.types import GenerateContentConfig
 
 from ..config import RETRY_CONFIG, MODEL_NAME
 from ..tools import update_job_history
+from ..utils import analyze_timeline, format_timeline
+
+
+def resume_context_injection(callback_context: CallbackContext, llm_request: LlmRequest):
+    """Inject precomputed work history timeline (gaps, overlaps, tenure) into the LLM request."""
+    if "job_history" in callback_context.state:
+        timeline_text = format_timeline(analyze_timeline(callback_context.state["job_history"]))
+        if not timeline_text:
+            return
+
+        injection = f"[CONTEXT - Work History Timeline]\n{timeline_text}\n\n[END CONTEXT]\n\n"
+        llm_request.config.system_instruction = injection + (llm_request.config.system_instruction or "")
 
 
 def create_resume_interviewer():
@@ -37,6 +51,9 @@ def create_resume_interviewer():
 - Ask open-ended questions to get detailed narratives
 - Follow up on interesting points to gather specifics
 - Be conversational and supportive
-- Summarize what you've learned periodically""",
-        tools=[update_job_history]
+- Summarize what you've learned periodically
+
+Remember: Employment gaps, overlapping roles and tenure are computed for you and provided automatically. Use them to ask about transitions instead of working them out yourself.""",
+        tools=[update_job_history],
+        before_model_callback=resume_context_injection
     )
@@ -25,6 +25,19 @@ MODEL_NAME = "gemini-2.5-flash-lite"
 
 # Database Configuration
 DATABASE_URL = "sqlite:///resume_sessions.db"
+ENTITY_INDEX_PATH = "entity_index.db"
+
+# Context Caching
+CONTEXT_CACHE_TTL_SECONDS = 1800
+# Invocations a cache is reused for before it is refreshed
+CONTEXT_CACHE_INTERVALS = 10
+# Minimum prompt tokens of the previous request before caching. Gemini's own
+# minimum (2048 tokens for Gemini 2.5) always applies on top of this, so
+# caching starts once a session's conversation has grown past it.
+CONTEXT_CACHE_MIN_TOKENS = 0
+
+# Tailored Resume Generation
+GENERATION_MAX_CONCURRENCY = 4
 
 # File Paths
 RESUME_FILE_PATH = "Clifford.Resume.2025.pdf"
@@ -0,0 +1,21 @@
+"""Tailored resume generation for job listings."""
+
+from .pipeline import (
+    ResumeGenerator,
+    TailoredResume,
+    TailoredExperience,
+    GenerationReport,
+    generate_tailored_resumes,
+)
+from .render import render_markdown, render_docx, render_pdf
+
+__all__ = [
+    "ResumeGenerator",
+    "TailoredResume",
+    "TailoredExperience",
+    "GenerationReport",
+    "generate_tailored_resumes",
+    "render_markdown",
+    "render_docx",
+    "render_pdf",
+]
@@ -0,0 +1,250 @@
+"""Batched tailored-resume generation across many job listings."""
+
+import asyncio
+import hashlib
+import os
+from typing import Awaitable, Callable
+
+from google import genai
+from google.genai import types
+from pydantic import BaseModel
+
+from ..config import GENERATION_MAX_CONCURRENCY, MODEL_NAME, RETRY_CONFIG
+from ..models import JobListing, ResumeProcessing
+from ..utils.text import mentions
+
+# How many matched skills define a listing cluster. Each role's bullets are
+# keyed on the cluster skills that role mentions, so listings share them
+# whenever they agree on what matters for that role.
+CLUSTER_SKILLS = 5
+
+# Introductions emphasize only the top few matched skills, so they are shared
+# across many more listings than the full cluster would allow
+INTRO_SKILLS = 2
+
+
+class TailoredExperience(BaseModel):
+    """A work history entry with bullets rewritten for a listing cluster."""
+    title: str
+    company: str
+    dates: str
+    bullets: list[str]
+
+
+class TailoredResume(BaseModel):
+    """A resume assembled for one job listing."""
+    listing: JobListing
+    cluster: list[str]
+    profile: ResumeProcessing
+    introduction: str | None = None
+    skills: list[str]
+    experience: list[TailoredExperience]
+
+
+class GenerationReport(BaseModel):
+    """LLM usage for one generate() call.
+
+    `llm_calls_avoided` is measured against `baseline_llm_calls`, one
+    whole-resume generation per listing, and is negative if fragment
+    generation cost more calls than that.
+    """
+    listings: int
+    clusters: int
+    fragments_requested: int
+    llm_calls: int
+    baseline_llm_calls: int
+    llm_calls_avoided: int
+
+
+def rank_skills(profile: ResumeProcessing, listing: JobListing) -> list[str]:
+    """Order the profile's skills by relevance to a listing (matched skills first)."""
+    listing_skills = [s.lower() for s in listing.skills or []]
+    listing_text = f"{listing.title} {listing.description}".lower()
+
+    def relevance(skill: str) -> int:
+        lowered = skill.lower()
+        if lowered in listing_skills:
+            return 2
+        if mentions(lowered, listing_text):
+            return 1
+        return 0
+
+    # sorted() is stable, so ties keep the candidate's own ordering
+    return sorted(profile.skills or [], key=relevance, reverse=True)
+
+
+def cluster_key(profile: ResumeProcessing, listing: JobListing, ranked_skills: list[str],
+                size: int = CLUSTER_SKILLS) -> tuple[str, ...]:
+    """Cluster listings by the top `size` profile skills they match."""
+    listing_text = f"{listing.title} {listing.description} {' '.join(listing.skills or [])}".lower()
+    matched = [s for s in ranked_skills if mentions(s, listing_text)]
+    return tuple(sorted(matched[:size]))
+
+
+def role_key(title: str, description: str, cluster: tuple[str, ...]) -> tuple[str, ...]:
+    """The cluster skills a role actually mentions; roles' bullets are shared on this key."""
+    role_text = f"{title} {description}".lower()
+    return tuple(s for s in cluster if mentions(s, role_text))
+
+
+def _bullets(text: str) -> list[str]:
+    """Split an LLM bullet list into clean lines."""
+    lines = [line.strip().lstrip("-*•").strip() for line in text.splitlines()]
+    return [line for line in lines if line]
+
+
+class ResumeGenerator:
+    """Generate tailored resumes for many listings from reusable fragments.
+
+    Each listing is reduced to a cluster of matched skills. The LLM-written
+    fragments (an introduction per top-skills pair, bullets per role per
+    cluster skills that role mentions) are keyed by their prompt, generated
+    once, and memoized across listings and across generate() calls;
+    everything else is assembled locally.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str], Awaitable[str]] | None = None,
+        max_concurrency: int = GENERATION_MAX_CONCURRENCY,
+    ):
+        """Create a generator with an empty fragment cache.
+
+        Args:
+            generate: Async prompt -> text function; defaults to a Gemini call
+            max_concurrency: Maximum number of LLM calls in flight at once
+        """
+        self._generate = generate or self._generate_with_gemini
+        self.max_concurrency = max_concurrency
+        # Finished fragments only; tasks and the semaphore belong to one generate() call's event loop
+        self._fragments: dict[str, str] = {}
+        self._client = None
+
+    async def _generate_with_gemini(self, prompt: str) -> str:
+        """Generate a fragment with a direct LLM call."""
+        if self._client is None:
+            self._client = genai.Client(
+                api_key=os.environ.get("GOOGLE_API_KEY"),
+                http_options=types.HttpOptions(retry_options=RETRY_CONFIG)
+            )
+        response = await self._client.aio.models.generate_content(
+            model=MODEL_NAME,
+            contents=prompt,
+            config=types.GenerateContentConfig(temperature=0.4, max_output_tokens=1000),
+        )
+        return (response.text or "").strip()
+
+    async def _call(self, semaphore: asyncio.Semaphore, prompt: str) -> str:
+        async with semaphore:
+            return await self._generate(prompt)
+
+    @staticmethod
+    def _introduction_prompt(profile: ResumeProcessing, cluster: tuple[str, ...]) -> str:
+        recent = ", ".join(f"{job.title} at {job.company}" for job in profile.work_history[:3])
+        return (
+            "Write a 2-3 sentence professional resume introduction in the first person, "
+            "without a heading.\n"
+            f"Candidate: {profile.name}\n"
+            f"Recent roles: {recent}\n"
+            f"Existing introduction: {profile.introduction or 'N/A'}\n"
+            f"Emphasize these skills: {', '.join(cluster) or 'overall experience'}"
+        )
+
+    @staticmethod
+    def _bullets_prompt(title: str, company: str, description: str, cluster: tuple[str, ...]) -> str:
+        return (
+            "Rewrite this role description as 3-5 concise, achievement-focused resume bullets, "
+            "one per line starting with '- '. Do not invent facts.\n"
+            f"Role: {title} at {company}\n"
+            f"Description: {description}\n"
+            f"Emphasize these skills where truthful: {', '.join(cluster) or 'overall impact'}"
+        )
+
+    async def generate(
+        self, profile: ResumeProcessing, listings: list[JobListing]
+    ) -> tuple[list[TailoredResume], GenerationReport]:
+        """Generate one tailored resume per listing.
+
+        Args:
+            profile: The parsed candidate resume
+            listings: Job listings to tailor against
+
+        Returns:
+            (resumes in listing order, report of LLM calls made and avoided)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending: dict[str, asyncio.Task] = {}
+        requested = 0
+
+        def fragment(prompt: str) -> str:
+            """Schedule a fragment unless it is already memoized or in flight; return its key."""
+            key = hashlib.sha256(prompt.encode()).hexdigest()
+            if key not in self._fragments and key not in pending:
+                pending[key] = asyncio.ensure_future(self._call(semaphore, prompt))
+            return key
+
+        plans = []
+        for listing in listings:
+            skills = rank_skills(profile, listing)
+            cluster = cluster_key(profile, listing, skills)
+            intro_skills = cluster_key(profile, listing, skills, size=INTRO_SKILLS)
+
+            intro = fragment(self._introduction_prompt(profile, intro_skills))
+            bullets = []
+            for job in profile.work_history:
+                if job.description:
+                    emphasis = role_key(job.title, job.description, cluster)
+                    bullets.append(fragment(self._bullets_prompt(job.title, job.company, job.description, emphasis)))
+                else:
+                    bullets.append(None)
+
+            requested += 1 + sum(key is not None for key in bullets)
+            plans.append((listing, skills, cluster, intro, bullets))
+
+        # Keep what succeeded, so a retry only regenerates the fragments that failed
+        results = await asyncio.gather(*pending.values(), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        self._fragments.update((key, r) for key, r in zip(pending, results) if not isinstance(r, BaseException))
+        if errors:
+            raise errors[0]
+
+        resumes = []
+        for listing, skills, cluster, intro, bullets in plans:
+            experience = [
+                TailoredExperience(
+                    title=job.title,
+                    company=job.company,
+                    dates=job.dates,
+                    bullets=_bullets(self._fragments[key]) if key is not None else [],
+                )
+                for job, key in zip(profile.work_history, bullets)
+            ]
+            resumes.append(TailoredResume(
+                listing=listing,
+                cluster=list(cluster),
+                profile=profile,
+                introduction=self._fragments[intro] or profile.introduction,
+                skills=skills,
+                experience=experience,
+            ))
+
+        report = GenerationReport(
+            listings=len(listings),
+            clusters=len({plan[2] for plan in plans}),
+            fragments_requested=requested,
+            llm_calls=len(pending),
+            baseline_llm_calls=len(listings),
+            llm_calls_avoided=len(listings) - len(pending),
+        )
+        print(f"[ResumeGenerator] {report.listings} listings in {report.clusters} clusters: "
+              f"{report.llm_calls} LLM calls vs {report.baseline_llm_calls} for one generation per listing")
+        return resumes, report
+
+
+async def generate_tailored_resumes(
+    profile: ResumeProcessing,
+    listings: list[JobListing],
+    max_concurrency: int = GENERATION_MAX_CONCURRENCY,
+) -> tuple[list[TailoredResume], GenerationReport]:
+    """Generate tailored resumes for a batch of listings with a fresh generator."""
+    return await ResumeGenerator(max_concurrency=max_concurrency).generate(profile, listings)
@@ -0,0 +1,92 @@
+"""Local rendering of tailored resumes to Markdown, DOCX and PDF."""
+
+from .pipeline import TailoredResume
+
+
+def render_markdown(resume: TailoredResume) -> str:
+    """Render a tailored resume as Markdown."""
+    profile = resume.profile
+    lines = [f"# {profile.name}", f"{profile.phone} | {profile.address}", ""]
+
+    if resume.introduction:
+        lines += [resume.introduction, ""]
+
+    if resume.skills:
+        lines += ["## Skills", ", ".join(resume.skills), ""]
+
+    if resume.experience:
+        lines.append("## Experience")
+        for job in resume.experience:
+            lines += ["", f"### {job.title} - {job.company}", f"*{job.dates}*"]
+            lines += [f"- {bullet}" for bullet in job.bullets]
+        lines.append("")
+
+    if profile.education:
+        lines.append("## Education")
+        for edu in profile.education:
+            entry = edu.institution
+            if edu.field_of_study:
+                entry += f", {edu.field_of_study}"
+            if edu.dates:
+                entry += f" ({edu.dates})"
+            lines.append(f"- {entry}")
+        lines.append("")
+
+    if profile.publications:
+        lines.append("## Publications")
+        for pub in profile.publications:
+            entry = f"- {pub.organization} ({pub.dates})"
+            lines.append(f"{entry}: {pub.description}" if pub.description else entry)
+        lines.append("")
+
+    if profile.volunteering:
+        lines.append("## Volunteering")
+        lines += [f"- {vol.title}, {vol.company} ({vol.dates})" for vol in profile.volunteering]
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def render_docx(resume: TailoredResume, path: str) -> str:
+    """Render a tailored resume to a DOCX file (requires python-docx)."""
+    try:
+        from docx import Document
+    except ImportError as e:
+        raise ImportError("DOCX output requires python-docx: pip install python-docx") from e
+
+    document = Document()
+    for line in render_markdown(resume).splitlines():
+        if line.startswith("### "):
+            document.add_heading(line[4:], level=2)
+        elif line.startswith("## "):
+            document.add_heading(line[3:], level=1)
+        elif line.startswith("# "):
+            document.add_heading(line[2:], level=0)
+        elif line.startswith("- "):
+            document.add_paragraph(line[2:], style="List Bullet")
+        elif line:
+            document.add_paragraph(line.strip("*"))
+    document.save(path)
+    return path
+
+
+def render_pdf(resume: TailoredResume, path: str) -> str:
+    """Render a tailored resume to a PDF file (requires fpdf2)."""
+    try:
+        from fpdf import FPDF
+    except ImportError as e:
+        raise ImportError("PDF output requires fpdf2: pip install fpdf2") from e
+
+    sizes = {"# ": 18, "## ": 14, "### ": 12}
+    pdf = FPDF()
+    pdf.add_page()
+    for line in render_markdown(resume).splitlines():
+        prefix = next((p for p in ("### ", "## ", "# ") if line.startswith(p)), None)
+        text = line[len(prefix):] if prefix else line.strip("*")
+        # Core PDF fonts are Latin-1 only
+        text = text.encode("latin-1", "replace").decode("latin-1")
+        pdf.set_font("Helvetica", "B" if prefix else "", sizes.get(prefix, 10))
+        # Return to the left margin after each line instead of fpdf2's default of staying right
+        pdf.multi_cell(0, 6, text or " ", new_x="LMARGIN", new_y="NEXT")
+    pdf.output(path)
+    return path
@@ -1,5 +1,7 @@
 """Pydantic models for resume data structures."""
 
+from .dates import DateRange, parse_date_range
+from .listing import JobListing
 from .resume import (
     JobHistory,
     Education,
@@ -8,8 +10,11 @@ from .resume import (
 )
 
 __all__ = [
+    "DateRange",
+    "parse_date_range",
     "JobHistory",
     "Education",
     "Publications",
     "ResumeProcessing",
+    "JobListing",
 ]
@@ -0,0 +1,123 @@
+"""Date range parsing for free-form resume date strings."""
+
+import re
+from datetime import date
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DateRange(BaseModel):
+    """Model for a normalized, month-granular date range.
+
+    `end` is None for ongoing ranges ("Present"); `is_current` marks those
+    explicitly so callers can resolve them against their own notion of today.
+    Endpoints written coarser than a month ("2019", "Summer 2020") are
+    widened to the earliest start and latest end; `start_precision` and
+    `end_precision` record how many months each endpoint could fall in.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    start: date | None = None
+    end: date | None = None
+    is_current: bool = False
+    start_precision: int = 1
+    end_precision: int = 1
+
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# (first month, last month) covered by each season
+SEASONS = {
+    "spring": (3, 5),
+    "summer": (6, 8),
+    "fall": (9, 11),
+    "autumn": (9, 11),
+    "winter": (1, 2),
+}
+
+CURRENT_WORDS = ("present", "current", "now", "today", "ongoing")
+
+# Order matters: the more specific alternatives must come first so that
+# "2018-06" is read as a month and "2015-2017" as two years.
+_ENDPOINT = re.compile(
+    r"(?P<current>\b(?:" + "|".join(CURRENT_WORDS) + r")\b)"
+    r"|(?P<season>\b(?:" + "|".join(SEASONS) + r"))\.?\s+(?P<season_year>\d{4})\b"
+    r"|\b(?P<month_name>jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)[a-z]*\.?,?\s+"
+    r"(?:(?P<month_name_year>\d{4})\b|['’](?P<month_name_short_year>\d{2})\b)"
+    r"|\b(?P<slash_month>0?[1-9]|1[0-2])[/.](?P<slash_year>\d{4})\b"
+    r"|\b(?P<iso_year>\d{4})-(?P<iso_month>0[1-9]|1[0-2])(?!\d)"
+    r"|\b(?P<year>(?:19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+
+
+def _short_year(digits: str) -> int:
+    """Expand a two-digit year ("'19") to four digits."""
+    year = int(digits)
+    return 2000 + year if year < 50 else 1900 + year
+
+
+def _parse_endpoint(match: re.Match) -> tuple[date | None, date | None, bool, int]:
+    """Convert an endpoint match into (earliest month, latest month, is_current, precision in months)."""
+    if match.group("current"):
+        return None, None, True, 1
+    if match.group("season"):
+        year = int(match.group("season_year"))
+        first, last = SEASONS[match.group("season").lower()]
+        return date(year, first, 1), date(year, last, 1), False, last - first + 1
+    if match.group("month_name"):
+        short_year = match.group("month_name_short_year")
+        year = _short_year(short_year) if short_year else int(match.group("month_name_year"))
+        month = MONTHS[match.group("month_name").lower()[:3]]
+        return date(year, month, 1), date(year, month, 1), False, 1
+    if match.group("slash_month"):
+        year, month = int(match.group("slash_year")), int(match.group("slash_month"))
+        return date(year, month, 1), date(year, month, 1), False, 1
+    if match.group("iso_year"):
+        year, month = int(match.group("iso_year")), int(match.group("iso_month"))
+        return date(year, month, 1), date(year, month, 1), False, 1
+    year = int(match.group("year"))
+    return date(year, 1, 1), date(year, 12, 1), False, 12
+
+
+@lru_cache(maxsize=4096)
+def parse_date_range(text: str | None) -> DateRange | None:
+    """Parse a free-form resume date string into a DateRange.
+
+    Handles the common resume formats, e.g. "Jan 2019 – Present", "2015-2017",
+    "Summer 2020", "06/2018 - 08/2019", "03.2018", "Jan '19" and
+    "2018-06 to 2019-08". A single endpoint ("2020", "Summer 2020") covers
+    its whole span. Results are
+    memoized since the same strings recur across turns and profiles.
+
+    Args:
+        text: The raw date string from the resume
+
+    Returns:
+        DateRange with month-granular start/end, or None if nothing parseable was found
+    """
+    if not text:
+        return None
+
+    endpoints = [_parse_endpoint(m) for m in _ENDPOINT.finditer(text)]
+    if not endpoints:
+        return None
+
+    first, last = endpoints[0], endpoints[-1]
+    if first[0] and last[0] and last[0] < first[0]:
+        # Reversed ranges ("2019 - 2017") are almost always typos for the other order
+        first, last = last, first
+
+    start = first[0]
+    end, is_current = last[1], last[2]
+    return DateRange(
+        start=start,
+        end=None if is_current else end,
+        is_current=is_current,
+        start_precision=first[3],
+        end_precision=last[3],
+    )
@@ -0,0 +1,11 @@
+"""Pydantic models for job listings."""
+
+from pydantic import BaseModel
+
+
+class JobListing(BaseModel):
+    """Model for a job listing to tailor a resume against."""
+    title: str
+    company: str
+    description: str
+    skills: list[str] | None = None
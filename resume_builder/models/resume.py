@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel
 
+from .dates import DateRange, parse_date_range
+
 
 class JobHistory(BaseModel):
     """Model for work experience entries."""
@@ -10,6 +12,11 @@ class JobHistory(BaseModel):
     company: str
     description: str | None = None
 
+    @property
+    def date_range(self) -> DateRange | None:
+        """Typed range parsed from the free-form `dates` string."""
+        return parse_date_range(self.dates)
+
 
 class Education(BaseModel):
     """Model for education entries."""
@@ -17,6 +24,11 @@ class Education(BaseModel):
     dates: str | None = None
     field_of_study: str | None = None
 
+    @property
+    def date_range(self) -> DateRange | None:
+        """Typed range parsed from the free-form `dates` string."""
+        return parse_date_range(self.dates)
+
 
 class Publications(BaseModel):
     """Model for publication entries."""
@@ -1,11 +1,25 @@
 """Utility functions for session management, file upload, and callbacks."""
 
 from .session import run_session
+from .cassette import Cassette, CassettePlugin, CassetteDivergenceError
 from .file_upload import upload_resume
 from .callbacks import trace_callback
+from .timeline import analyze_timeline, analyze_timelines, format_timeline
+from .entity_index import EntityIndex, normalize_name
+from .context_cache import CacheUsagePlugin, create_context_cache_config
 
 __all__ = [
     "run_session",
+    "Cassette",
+    "CassettePlugin",
+    "CassetteDivergenceError",
     "upload_resume",
     "trace_callback",
+    "analyze_timeline",
+    "analyze_timelines",
+    "format_timeline",
+    "EntityIndex",
+    "normalize_name",
+    "CacheUsagePlugin",
+    "create_context_cache_config",
 ]
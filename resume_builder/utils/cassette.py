@@ -0,0 +1,253 @@
+"""Record/replay cassettes for deterministic, offline agent runs."""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+CASSETTE_VERSION = 1
+
+# EventActions fields a tool can set that change how the run continues
+REPLAYED_ACTIONS = ("transfer_to_agent", "escalate", "skip_summarization")
+
+
+class CassetteDivergenceError(RuntimeError):
+    """Raised when a replayed run stops matching its cassette."""
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip through JSON so recorded and live values compare equal."""
+    return json.loads(json.dumps(value, sort_keys=True, default=str))
+
+
+def _scrub_ids(value: Any) -> Any:
+    """Drop function call ids, which ADK regenerates randomly on every run."""
+    if isinstance(value, dict):
+        return {k: _scrub_ids(v) for k, v in value.items() if k != "id"}
+    if isinstance(value, list):
+        return [_scrub_ids(v) for v in value]
+    return value
+
+
+def request_digest(llm_request: LlmRequest) -> str:
+    """Stable fingerprint of a model request (model, instruction and contents)."""
+    system_instruction = llm_request.config.system_instruction if llm_request.config else None
+    payload = {
+        "model": llm_request.model,
+        "system_instruction": str(system_instruction) if system_instruction else None,
+        "contents": _scrub_ids([
+            content.model_dump(mode="json", exclude_none=True) for content in llm_request.contents
+        ]),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _last_user_text(llm_request: LlmRequest) -> str:
+    """First 80 chars of the latest user text, to make divergences readable."""
+    for content in reversed(llm_request.contents or []):
+        if content.role == "user" and content.parts:
+            for part in content.parts:
+                if part.text:
+                    return part.text[:80]
+    return ""
+
+
+class Cassette:
+    """Ordered log of model, tool and state interactions from one recorded run.
+
+    Stored as gzipped JSON. Model requests are kept only as digests, so a
+    cassette holds little more than the model responses themselves.
+    """
+
+    def __init__(self, path: str, current_date: str | None = None, interactions: list[dict] | None = None):
+        self.path = path
+        self.current_date = current_date
+        self.interactions = interactions or []
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Load a cassette previously written by save()."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}: {data.get('version')}")
+        return cls(path, current_date=data.get("current_date"), interactions=data["interactions"])
+
+    def save(self):
+        """Write the cassette to its path."""
+        data = {
+            "version": CASSETTE_VERSION,
+            "current_date": self.current_date,
+            "interactions": self.interactions,
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), default=str)
+
+    def of_kind(self, kind: str) -> list[dict]:
+        """Interactions of one kind ('model', 'tool' or 'state'), in recorded order."""
+        return [i for i in self.interactions if i["kind"] == kind]
+
+
+class CassettePlugin(BasePlugin):
+    """Runner plugin that records a run into a cassette or replays one.
+
+    In record mode every model request/response, tool call (result and
+    actions) and event state delta is appended to the cassette. In replay
+    mode model calls and tools are short-circuited with the recorded values,
+    so the same Runner and agent tree run with no network access, and any
+    mismatch in requests, tool calls or state deltas is flagged.
+    """
+
+    def __init__(self, cassette: Cassette, replay: bool = False, strict: bool = False):
+        super().__init__(name="cassette")
+        self.cassette = cassette
+        self.replay = replay
+        self.strict = strict
+        self.divergences: list[str] = []
+        self._queues = {kind: cassette.of_kind(kind) for kind in ("model", "tool", "state")} if replay else {}
+        self._cursor = {"model": 0, "tool": 0, "state": 0}
+        self._pending_model: dict | None = None
+        if not replay:
+            # Fail before any paid API calls rather than losing the recording on save
+            os.makedirs(os.path.dirname(cassette.path) or ".", exist_ok=True)
+
+    def _diverge(self, message: str):
+        """Flag a divergence, raising immediately in strict mode."""
+        self.divergences.append(message)
+        print(f"[cassette] DIVERGENCE: {message}")
+        if self.strict:
+            raise CassetteDivergenceError(message)
+
+    def _next(self, kind: str) -> dict:
+        """Pop the next recorded interaction of a kind; running out is always fatal."""
+        queue, cursor = self._queues[kind], self._cursor[kind]
+        if cursor >= len(queue):
+            raise CassetteDivergenceError(
+                f"Cassette {self.cassette.path} has no more recorded {kind} interactions (used {cursor})"
+            )
+        self._cursor[kind] += 1
+        return queue[cursor]
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        digest = request_digest(llm_request)
+        if not self.replay:
+            self._pending_model = {
+                "kind": "model",
+                "agent": callback_context.agent_name,
+                "request": digest,
+                "preview": _last_user_text(llm_request),
+            }
+            self.cassette.interactions.append(self._pending_model)
+            return None
+
+        recorded = self._next("model")
+        if "response" not in recorded:
+            # Left by a recording whose model call failed; there is nothing to replay
+            raise CassetteDivergenceError(
+                f"Recorded model call #{self._cursor['model']} for {recorded['agent']} in "
+                f"{self.cassette.path} has no response"
+            )
+        if recorded["agent"] != callback_context.agent_name or recorded["request"] != digest:
+            self._diverge(
+                f"model request #{self._cursor['model']} for {callback_context.agent_name} "
+                f"does not match recorded request for {recorded['agent']} "
+                f"(recorded query: {recorded.get('preview')!r}, live query: {_last_user_text(llm_request)!r})"
+            )
+        return LlmResponse.model_validate(recorded["response"])
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        if not self.replay and self._pending_model is not None:
+            self._pending_model["response"] = llm_response.model_dump(mode="json", exclude_none=True)
+        return None
+
+    async def before_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext
+    ) -> Optional[dict]:
+        if not self.replay:
+            return None
+
+        recorded = self._next("tool")
+        if recorded["name"] != tool.name or recorded["args"] != _normalize(tool_args):
+            self._diverge(
+                f"tool call #{self._cursor['tool']} {tool.name}({tool_args}) "
+                f"does not match recorded {recorded['name']}({recorded['args']})"
+            )
+
+        # Re-apply the tool's side effects so the run continues as recorded
+        for key, value in recorded["actions"].get("state_delta", {}).items():
+            tool_context.state[key] = value
+        for field in REPLAYED_ACTIONS:
+            if field in recorded["actions"]:
+                setattr(tool_context.actions, field, recorded["actions"][field])
+        return recorded["result"]
+
+    async def after_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext, result: dict
+    ) -> Optional[dict]:
+        if self.replay:
+            return None
+
+        actions = {"state_delta": dict(tool_context.actions.state_delta)}
+        for field in REPLAYED_ACTIONS:
+            value = getattr(tool_context.actions, field, None)
+            if value is not None:
+                actions[field] = value
+        self.cassette.interactions.append({
+            "kind": "tool",
+            "name": tool.name,
+            "args": _normalize(tool_args),
+            # ADK wraps non-dict tool results the same way before building the event
+            "result": _normalize(result if isinstance(result, dict) else {"result": result}),
+            "actions": _normalize(actions),
+        })
+        return None
+
+    async def on_event_callback(
+        self, *, invocation_context: InvocationContext, event: Event
+    ) -> Optional[Event]:
+        if not event.actions or not event.actions.state_delta:
+            return None
+
+        delta = _normalize(event.actions.state_delta)
+        if not self.replay:
+            self.cassette.interactions.append({"kind": "state", "author": event.author, "delta": delta})
+            return None
+
+        if self._cursor["state"] >= len(self._queues["state"]):
+            self._diverge(f"unexpected state delta from {event.author}: {sorted(delta)}")
+            return None
+        recorded = self._next("state")
+        if recorded["author"] != event.author or recorded["delta"] != delta:
+            self._diverge(
+                f"state delta #{self._cursor['state']} from {event.author} (keys {sorted(delta)}) "
+                f"does not match recorded delta from {recorded['author']} (keys {sorted(recorded['delta'])})"
+            )
+        return None
+
+    def report(self) -> str:
+        """One-line summary of what was recorded or replayed."""
+        counts = {kind: len(self.cassette.of_kind(kind)) for kind in ("model", "tool", "state")}
+        if not self.replay:
+            return (f"Recorded {counts['model']} model calls, {counts['tool']} tool calls and "
+                    f"{counts['state']} state deltas to {self.cassette.path}")
+
+        unused = {kind: counts[kind] - self._cursor[kind] for kind in counts if counts[kind] > self._cursor[kind]}
+        summary = (f"Replayed {self._cursor['model']} model calls and {self._cursor['tool']} tool calls "
+                   f"from {self.cassette.path}; {len(self.divergences)} divergences")
+        if unused:
+            summary += f"; unused recorded interactions: {unused}"
+        return summary
@@ -0,0 +1,67 @@
+"""Context caching for agent prompts and reporting of the tokens it saves."""
+
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+
+from ..config import CONTEXT_CACHE_INTERVALS, CONTEXT_CACHE_MIN_TOKENS, CONTEXT_CACHE_TTL_SECONDS
+
+
+def create_context_cache_config() -> ContextCacheConfig:
+    """Context cache settings for App(context_cache_config=...).
+
+    ADK caches each agent's instruction, tools and stable conversation
+    prefix, fingerprints the prefix to invalidate the cache when it changes
+    (e.g. after injected candidate background changes) and refreshes it on
+    TTL or after CONTEXT_CACHE_INTERVALS invocations.
+    """
+    return ContextCacheConfig(
+        cache_intervals=CONTEXT_CACHE_INTERVALS,
+        ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+        min_tokens=CONTEXT_CACHE_MIN_TOKENS,
+    )
+
+
+class CacheUsagePlugin(BasePlugin):
+    """Runner plugin that tallies prompt tokens served from the context cache.
+
+    Figures come from the model's own usage metadata (prompt_token_count and
+    cached_content_token_count), so savings are what was actually billed as
+    cached rather than an estimate.
+    """
+
+    def __init__(self):
+        super().__init__(name="cache_usage")
+        self.stats: dict[str, dict[str, int]] = {}
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        usage = llm_response.usage_metadata
+        if usage is None or llm_response.partial:
+            return None
+
+        agent = self.stats.setdefault(
+            callback_context.agent_name, {"requests": 0, "cached_requests": 0, "prompt_tokens": 0, "cached_tokens": 0}
+        )
+        cached = usage.cached_content_token_count or 0
+        agent["requests"] += 1
+        agent["cached_requests"] += cached > 0
+        agent["prompt_tokens"] += usage.prompt_token_count or 0
+        agent["cached_tokens"] += cached
+        return None
+
+    def report(self) -> dict:
+        """Totals and per-agent counts, with the share of prompt tokens served from cache."""
+        totals = {"requests": 0, "cached_requests": 0, "prompt_tokens": 0, "cached_tokens": 0}
+        for agent in self.stats.values():
+            for key in totals:
+                totals[key] += agent[key]
+        totals["cached_share"] = (
+            round(totals["cached_tokens"] / totals["prompt_tokens"], 3) if totals["prompt_tokens"] else 0.0
+        )
+        totals["agents"] = {name: dict(agent) for name, agent in self.stats.items()}
+        return totals
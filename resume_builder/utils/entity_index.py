@@ -0,0 +1,372 @@
+"""Persistent entity resolution for companies, institutions and organizations."""
+
+import re
+import sqlite3
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from ..config import ENTITY_INDEX_PATH
+from ..models import ResumeProcessing
+
+# Profile fields that mention entities, and the entity kind each resolves to
+ENTITY_FIELDS = {
+    "work_history": ("company", "company"),
+    "volunteering": ("company", "company"),
+    "education": ("institution", "institution"),
+    "publications": ("organization", "organization"),
+}
+
+# Character trigram Jaccard below which an alias is rejected without closer comparison
+# (low enough that transpositions like "goolge" still reach the token check)
+CANDIDATE_THRESHOLD = 0.2
+
+# Token-aligned similarity needed to treat two names as one entity
+MATCH_THRESHOLD = 0.8
+
+# Upper bound on candidates compared per lookup
+MAX_CANDIDATES = 200
+
+# Blocking keys shared by more aliases than this (common trigrams like "ing")
+# are skipped at lookup, so each lookup reads a bounded number of block rows
+# however large the index grows. Rarer keys of the same name still match it.
+MAX_BLOCK_SIZE = 32
+
+# Keys a candidate must share with a name (acronym matches aside); one shared
+# trigram never clears CANDIDATE_THRESHOLD
+MIN_SHARED_KEYS = 2
+
+# Factor applied when a generic token moves across the distinctive part of a
+# name, e.g. "washington university" vs "university of washington"
+REORDER_PENALTY = 0.5
+
+ABBREVIATIONS = {
+    "univ": "university", "uni": "university",
+    "inst": "institute", "tech": "technology", "intl": "international",
+    "natl": "national", "dept": "department", "ctr": "center", "centre": "center",
+    "&": "and", "st": "saint",
+}
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation",
+    "co", "company", "plc", "gmbh", "ag", "sa", "lp", "llp", "pty",
+}
+
+STOPWORDS = {"the", "of", "and", "at", "for", "in"}
+
+# Too common to block on by themselves; still used for similarity and acronyms
+GENERIC_TOKENS = {
+    "university", "college", "institute", "school", "academy", "department",
+    "group", "technology", "technologies", "systems", "solutions", "services",
+    "international", "global", "national", "labs", "center", "state",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    canonical TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    kind TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    entity_id INTEGER NOT NULL REFERENCES entities(id),
+    alias TEXT NOT NULL,
+    PRIMARY KEY (kind, normalized)
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    PRIMARY KEY (kind, key, normalized)
+);
+CREATE TABLE IF NOT EXISTS block_sizes (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    entity_id INTEGER NOT NULL REFERENCES entities(id),
+    candidate_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    raw TEXT NOT NULL,
+    PRIMARY KEY (entity_id, candidate_id, field, raw)
+);
+CREATE INDEX IF NOT EXISTS mentions_by_candidate ON mentions(candidate_id);
+"""
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(name: str) -> str:
+    """Normalize an entity name: lowercase, expand abbreviations, drop punctuation and legal suffixes."""
+    tokens = re.findall(r"[a-z0-9&]+", name.lower().replace("'", ""))
+    tokens = [ABBREVIATIONS.get(t, t) for t in tokens]
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    if len(tokens) > 1 and tokens[0] == "the":
+        tokens = tokens[1:]
+    return " ".join(tokens)
+
+
+def _acronym(normalized: str) -> str:
+    """Initials of the significant tokens ("massachusetts institute of technology" -> "mit")."""
+    return "".join(t[0] for t in normalized.split() if t not in STOPWORDS)
+
+
+@lru_cache(maxsize=65536)
+def _trigrams(normalized: str) -> frozenset[str]:
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def blocking_keys(normalized: str) -> set[str]:
+    """Keys that any plausible variant of a name shares with it.
+
+    Character trigrams of the distinctive tokens catch misspellings anywhere
+    in a name ("mircosoft"), whole distinctive tokens stay selective when
+    every trigram is common, and acronym keys pair "mit" with its expansion.
+    """
+    tokens = [t for t in normalized.split() if t not in STOPWORDS]
+    core = " ".join(t for t in tokens if t not in GENERIC_TOKENS)
+    keys = set()
+    if core:
+        padded = f" {core} "
+        keys.update(f"g:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        keys.update(f"t:{t}" for t in core.split())
+    else:
+        # Only generic tokens, e.g. "State University": block on the whole name
+        keys.add(f"n:{normalized}")
+    if len(tokens) > 1:
+        keys.add(f"a:{_acronym(normalized)}")
+    elif tokens:
+        keys.add(f"a:{tokens[0]}")
+    return keys
+
+
+@lru_cache(maxsize=65536)
+def _token_ratio(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _is_acronym_of(query: str, candidate: str) -> bool:
+    """Whether a one-token query abbreviates a multi-token full name ("mit")."""
+    return " " not in query and " " in candidate and query == _acronym(candidate)
+
+
+def _generic_sides(tokens: list[str]) -> dict[str, bool]:
+    """For each generic token, whether it comes before the first distinctive token."""
+    first_core = next((i for i, t in enumerate(tokens) if t not in GENERIC_TOKENS), None)
+    if first_core is None:
+        return {}
+    return {t: i < first_core for i, t in enumerate(tokens) if t in GENERIC_TOKENS}
+
+
+def name_similarity(query: str, candidate: str) -> float:
+    """Similarity of a normalized query name to a stored one, in [0, 1].
+
+    A query that is the acronym of a full name scores 1; a full-name query
+    never matches a stored acronym, which could stand for anything starting
+    with the same letters. Otherwise names must pass a cheap character
+    trigram Jaccard filter, then every token of the longer name is aligned
+    with its closest token in the shorter one, so typos score high
+    ("googel"/"google") but extra tokens don't ("washington state
+    university"/"university of washington"). Moving a generic token to the
+    other side of the name ("miami university"/"university of miami")
+    is penalized.
+    """
+    if query == candidate:
+        return 1.0
+    if _is_acronym_of(query, candidate):
+        return 1.0
+
+    ta, tb = _trigrams(query), _trigrams(candidate)
+    if len(ta & tb) / len(ta | tb) < CANDIDATE_THRESHOLD:
+        return 0.0
+
+    tokens_a = [t for t in query.split() if t not in STOPWORDS]
+    tokens_b = [t for t in candidate.split() if t not in STOPWORDS]
+    sides_a, sides_b = _generic_sides(tokens_a), _generic_sides(tokens_b)
+    if len(tokens_a) < len(tokens_b):
+        tokens_a, tokens_b = tokens_b, tokens_a
+    aligned = sum(max(_token_ratio(x, y) for y in tokens_b) for x in tokens_a)
+    score = aligned / len(tokens_a)
+    if any(sides_b[t] != side for t, side in sides_a.items() if t in sides_b):
+        score *= REORDER_PENALTY
+    return score
+
+
+class EntityIndex:
+    """SQLite-backed index assigning canonical entity ids to name variants.
+
+    New names are resolved against existing aliases that share a blocking
+    key (character trigrams, tokens and acronyms). Keys shared by more than
+    MAX_BLOCK_SIZE aliases are skipped, candidates are ranked by how many
+    keys they share and only the top MAX_CANDIDATES are compared, so each
+    insert reads a bounded number of rows rather than a growing share of
+    the index, and inserts are incremental.
+    """
+
+    def __init__(self, path: str = ENTITY_INDEX_PATH, threshold: float = MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _alias_entity(self, kind: str, normalized: str) -> int | None:
+        row = self._conn.execute(
+            "SELECT entity_id FROM aliases WHERE kind = ? AND normalized = ?", (kind, normalized)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _candidates(self, kind: str, normalized: str) -> list[tuple[str, int]]:
+        """Return (alias, entity id) pairs sharing a selective blocking key with a name.
+
+        Candidates are ranked before truncation (acronym matches first, then
+        by number of shared keys, then by name) so the cut is deterministic
+        and keeps the likeliest matches.
+        """
+        keys = sorted(blocking_keys(normalized))
+        keys = [row[0] for row in self._conn.execute(
+            f"SELECT key FROM block_sizes WHERE kind = ? AND key IN ({','.join('?' * len(keys))}) AND size <= ?",
+            (kind, *keys, MAX_BLOCK_SIZE),
+        )]
+        if not keys:
+            return []
+        return self._conn.execute(
+            f"SELECT b.normalized, a.entity_id FROM blocks b "
+            f"JOIN aliases a ON a.kind = b.kind AND a.normalized = b.normalized "
+            f"WHERE b.kind = ? AND b.key IN ({','.join('?' * len(keys))}) "
+            f"GROUP BY b.normalized HAVING COUNT(*) >= ? OR MAX(b.key LIKE 'a:%') "
+            f"ORDER BY MAX(b.key LIKE 'a:%') DESC, COUNT(*) DESC, b.normalized LIMIT ?",
+            (kind, *keys, MIN_SHARED_KEYS, MAX_CANDIDATES),
+        ).fetchall()
+
+    def _best_match(self, kind: str, normalized: str) -> int | None:
+        """Find the closest existing alias among the candidates for a name.
+
+        An acronym only resolves when every full name it abbreviates belongs
+        to one entity ("ge" stays unresolved given General Electric and
+        Global Energy).
+        """
+        best_id, best_score = None, self.threshold
+        abbreviated = set()
+        for candidate, entity_id in self._candidates(kind, normalized):
+            if _is_acronym_of(normalized, candidate):
+                abbreviated.add(entity_id)
+                continue
+            score = name_similarity(normalized, candidate)
+            if score >= best_score:
+                best_id, best_score = entity_id, score
+        if best_id is None and len(abbreviated) == 1:
+            best_id = abbreviated.pop()
+        return best_id
+
+    def lookup(self, name: str, kind: str) -> int | None:
+        """Return the entity id for a name without adding anything to the index."""
+        normalized = normalize_name(name or "")
+        if not normalized:
+            return None
+        return self._alias_entity(kind, normalized) or self._best_match(kind, normalized)
+
+    def resolve(self, name: str, kind: str) -> int | None:
+        """Return the entity id for a name, creating an entity or alias as needed."""
+        normalized = normalize_name(name or "")
+        if not normalized:
+            return None
+
+        entity_id = self._alias_entity(kind, normalized)
+        if entity_id is not None:
+            return entity_id
+
+        with self._conn:
+            entity_id = self._best_match(kind, normalized)
+            if entity_id is None:
+                entity_id = self._conn.execute(
+                    "INSERT INTO entities (kind, canonical) VALUES (?, ?)", (kind, name.strip())
+                ).lastrowid
+            self._conn.execute(
+                "INSERT INTO aliases (kind, normalized, entity_id, alias) VALUES (?, ?, ?, ?)",
+                (kind, normalized, entity_id, name.strip()),
+            )
+            keys = [(kind, key, normalized) for key in blocking_keys(normalized)]
+            self._conn.executemany("INSERT INTO blocks (kind, key, normalized) VALUES (?, ?, ?)", keys)
+            self._conn.executemany(
+                "INSERT INTO block_sizes (kind, key, size) VALUES (?, ?, 1) "
+                "ON CONFLICT (kind, key) DO UPDATE SET size = size + 1",
+                [(kind, key) for kind, key, _ in keys],
+            )
+        return entity_id
+
+    def ingest_profile(self, candidate_id: str, profile: ResumeProcessing | dict) -> dict[str, list[int | None]]:
+        """Resolve every entity mentioned in a profile and record the candidate's mentions.
+
+        Re-ingesting a candidate replaces their previous mentions.
+
+        Args:
+            candidate_id: Stable identifier for the candidate
+            profile: Parsed resume, as a ResumeProcessing model or state dict
+
+        Returns:
+            Entity ids per field, aligned with the entries of that field
+        """
+        if isinstance(profile, ResumeProcessing):
+            profile = profile.model_dump()
+
+        resolved = {}
+        mentions = []
+        for field, (attr, kind) in ENTITY_FIELDS.items():
+            ids = []
+            for entry in profile.get(field) or []:
+                raw = entry.get(attr) if isinstance(entry, dict) else None
+                entity_id = self.resolve(raw, kind) if raw else None
+                ids.append(entity_id)
+                if entity_id is not None:
+                    mentions.append((entity_id, candidate_id, field, raw))
+            resolved[field] = ids
+
+        with self._conn:
+            self._conn.execute("DELETE FROM mentions WHERE candidate_id = ?", (candidate_id,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO mentions (entity_id, candidate_id, field, raw) VALUES (?, ?, ?, ?)",
+                mentions,
+            )
+        return resolved
+
+    def canonical_name(self, entity_id: int) -> str | None:
+        """Return the canonical (first seen) spelling of an entity."""
+        row = self._conn.execute("SELECT canonical FROM entities WHERE id = ?", (entity_id,)).fetchone()
+        return row[0] if row else None
+
+    def aliases(self, entity_id: int) -> list[str]:
+        """Return every spelling seen for an entity."""
+        rows = self._conn.execute("SELECT alias FROM aliases WHERE entity_id = ? ORDER BY alias", (entity_id,))
+        return [row[0] for row in rows]
+
+    def candidates_for(self, name: str, kind: str = "company", field: str | None = None) -> list[str]:
+        """Return candidate ids mentioning an entity, e.g. everyone who worked at a company.
+
+        Args:
+            name: Any spelling of the entity
+            kind: 'company', 'institution' or 'organization'
+            field: Restrict to one profile field (e.g. 'work_history' to exclude volunteering)
+        """
+        entity_id = self.lookup(name, kind)
+        if entity_id is None:
+            return []
+        query = "SELECT DISTINCT candidate_id FROM mentions WHERE entity_id = ?"
+        params = [entity_id]
+        if field:
+            query += " AND field = ?"
+            params.append(field)
+        return [row[0] for row in self._conn.execute(query + " ORDER BY candidate_id", params)]
+
+    def entities_for(self, candidate_id: str) -> list[tuple[int, str, str]]:
+        """Return (entity_id, canonical name, field) for every entity a candidate mentions."""
+        rows = self._conn.execute(
+            "SELECT DISTINCT m.entity_id, e.canonical, m.field FROM mentions m "
+            "JOIN entities e ON e.id = m.entity_id WHERE m.candidate_id = ? ORDER BY m.field, e.canonical",
+            (candidate_id,),
+        )
+        return [tuple(row) for row in rows]
@@ -5,6 +5,7 @@ from google.genai import types
 from google.adk.runners import Runner
 
 from ..config import USER_ID, MODEL_NAME
+from .cassette import Cassette, CassetteDivergenceError, CassettePlugin
 
 # Track which sessions have had date context injected
 sessions_with_date = set()
@@ -15,8 +16,24 @@ async def run_session(
     session_service,
     user_queries: list[str | types.Content] | str | types.Content = None,
     session_name: str = "default",
+    cassette_path: str | None = None,
+    replay: bool = False,
+    strict_replay: bool = False,
 ):
-    """Execute a session with the agent, processing user queries."""
+    """Execute a session with the agent, processing user queries.
+
+    Args:
+        runner_instance: The Runner to execute queries with
+        session_service: Session service holding the conversation
+        user_queries: One or more queries (strings or Content objects)
+        session_name: Session id to resume or create
+        cassette_path: If set, record the run to this cassette file (or replay from it)
+        replay: Replay model responses and tool results from cassette_path instead of calling them
+        strict_replay: Raise CassetteDivergenceError on the first divergence instead of reporting it
+
+    Returns:
+        The CassettePlugin used (with its divergences), or None if no cassette was given
+    """
     global sessions_with_date
 
     print(f"\n ### Session: {session_name}")
@@ -43,56 +60,94 @@ async def run_session(
         print(f"[run_session] Created new session '{session_name}'")
         is_new_session = True
 
-    # Process queries if provided
-    if user_queries:
-        # Convert single query to list for uniform processing
-        if isinstance(user_queries, (str, types.Content)):
-            user_queries = [user_queries]
-
-        # For new sessions, prepend date context to the first query
-        if is_new_session and session_name not in sessions_with_date:
-            current_date = datetime.now().strftime("%A, %B %d, %Y")
-            date_context = f"[Today's date: {current_date}]\n\n"
-
-            # Add date to first query
-            first_query = user_queries[0]
-            if isinstance(first_query, str):
-                user_queries[0] = date_context + first_query
+    # Attach the record/replay plugin for the duration of this call
+    cassette_plugin = None
+    if cassette_path:
+        cassette = Cassette.load(cassette_path) if replay else Cassette(cassette_path)
+        cassette_plugin = CassettePlugin(cassette, replay=replay, strict=strict_replay)
+        runner_instance.plugin_manager.register_plugin(cassette_plugin)
+        print(f"[run_session] {'Replaying' if replay else 'Recording'} cassette '{cassette_path}'")
+
+    completed = False
+    try:
+        # Process queries if provided
+        if user_queries:
+            # Convert single query to list for uniform processing
+            if isinstance(user_queries, (str, types.Content)):
+                user_queries = [user_queries]
+
+            # For new sessions, prepend date context to the first query
+            # (on replay, exactly when the recording had it, so requests match)
+            if replay and cassette_plugin is not None:
+                add_date = is_new_session and cassette_plugin.cassette.current_date is not None
             else:
-                # It's a Content object, prepend to first text part
-                if hasattr(first_query, 'parts') and first_query.parts:
-                    for part in first_query.parts:
-                        if hasattr(part, 'text') and part.text:
-                            part.text = date_context + part.text
-                            break
-
-            sessions_with_date.add(session_name)
-            print(f"[run_session] Added date context: {current_date}")
-
-        # Process each query in the list sequentially
-        for query in user_queries:
-            print(f"\nUser > {query if isinstance(query, str) else 'Content with file'}")
-
-            # Convert string queries to ADK Content format, leave Content objects as-is
-            if isinstance(query, str):
-                query = types.Content(role="user", parts=[types.Part(text=query)])
-
-            # Stream the agent's response asynchronously
-            async for event in runner_instance.run_async(
-                user_id=USER_ID, session_id=session.id, new_message=query
-            ):
-                # Check if the event contains valid content
-                if event.content and event.content.parts:
-                    # Handle all parts in the response
-                    for part in event.content.parts:
-                        # Handle text parts
-                        if part.text and part.text != "None":
-                            print(f"{MODEL_NAME} > ", part.text)
-                        # Handle function calls (agent delegation)
-                        elif hasattr(part, 'function_call') and part.function_call:
-                            print(f"{MODEL_NAME} > [Calling function: {part.function_call.name}]")
-                        # Handle function responses
-                        elif hasattr(part, 'function_response') and part.function_response:
-                            print(f"{MODEL_NAME} > [Function response received]")
-    else:
-        print("No queries!")
+                add_date = is_new_session and session_name not in sessions_with_date
+            if add_date:
+                current_date = datetime.now().strftime("%A, %B %d, %Y")
+                if cassette_plugin is not None:
+                    # Freeze the date so replayed requests match the recording
+                    if replay:
+                        current_date = cassette_plugin.cassette.current_date
+                    cassette_plugin.cassette.current_date = current_date
+                date_context = f"[Today's date: {current_date}]\n\n"
+
+                # Add date to first query
+                first_query = user_queries[0]
+                if isinstance(first_query, str):
+                    user_queries[0] = date_context + first_query
+                else:
+                    # It's a Content object, prepend to first text part
+                    if hasattr(first_query, 'parts') and first_query.parts:
+                        for part in first_query.parts:
+                            if hasattr(part, 'text') and part.text:
+                                part.text = date_context + part.text
+                                break
+
+                sessions_with_date.add(session_name)
+                print(f"[run_session] Added date context: {current_date}")
+
+            # Process each query in the list sequentially
+            for query in user_queries:
+                print(f"\nUser > {query if isinstance(query, str) else 'Content with file'}")
+
+                # Convert string queries to ADK Content format, leave Content objects as-is
+                if isinstance(query, str):
+                    query = types.Content(role="user", parts=[types.Part(text=query)])
+
+                # Stream the agent's response asynchronously
+                async for event in runner_instance.run_async(
+                    user_id=USER_ID, session_id=session.id, new_message=query
+                ):
+                    # Check if the event contains valid content
+                    if event.content and event.content.parts:
+                        # Handle all parts in the response
+                        for part in event.content.parts:
+                            # Handle text parts
+                            if part.text and part.text != "None":
+                                print(f"{MODEL_NAME} > ", part.text)
+                            # Handle function calls (agent delegation)
+                            elif hasattr(part, 'function_call') and part.function_call:
+                                print(f"{MODEL_NAME} > [Calling function: {part.function_call.name}]")
+                            # Handle function responses
+                            elif hasattr(part, 'function_response') and part.function_response:
+                                print(f"{MODEL_NAME} > [Function response received]")
+        else:
+            print("No queries!")
+        completed = True
+    except RuntimeError as e:
+        # ADK wraps plugin exceptions; surface strict-replay divergences as themselves
+        if isinstance(e.__cause__, CassetteDivergenceError):
+            raise e.__cause__ from None
+        raise
+    finally:
+        if cassette_plugin is not None:
+            runner_instance.plugin_manager.plugins.remove(cassette_plugin)
+            if not replay:
+                if completed:
+                    cassette_plugin.cassette.save()
+                else:
+                    # A failed run can't be replayed past the failure; keep any earlier cassette
+                    print(f"[run_session] Run failed; not saving cassette '{cassette_path}'")
+            print(f"[run_session] {cassette_plugin.report()}")
+
+    return cassette_plugin
@@ -0,0 +1,8 @@
+"""Text matching helpers shared by the analytics and generation modules."""
+
+import re
+
+
+def mentions(term: str, text: str) -> bool:
+    """Whole-word, case-insensitive match, so "Go" doesn't match "Good" and "C" doesn't match "consulting"."""
+    return re.search(rf"(?<!\w){re.escape(term)}(?!\w)", text, re.IGNORECASE) is not None
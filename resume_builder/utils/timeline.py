@@ -0,0 +1,199 @@
+"""Work history timeline analytics: gaps, overlaps, tenure and skill years."""
+
+from datetime import date
+
+import numpy as np
+
+from ..models import ResumeProcessing, parse_date_range
+from .text import mentions
+
+# Month-granular dates make 1-month gaps/overlaps mostly rounding noise
+MIN_GAP_MONTHS = 3
+MIN_OVERLAP_MONTHS = 2
+
+
+def _as_dict(profile: ResumeProcessing | dict) -> dict:
+    """Accept either a parsed model or the dict stored in session state."""
+    if isinstance(profile, ResumeProcessing):
+        return profile.model_dump()
+    return profile or {}
+
+
+def _month_label(month: int) -> str:
+    """Format a months-since-epoch integer as YYYY-MM."""
+    return str(np.datetime64(int(month), "M"))
+
+
+def analyze_timelines(profiles: list[ResumeProcessing | dict], today: date | None = None) -> list[dict]:
+    """Compute timeline analytics for many profiles in one vectorized pass.
+
+    Every dated role across all profiles is flattened into NumPy month arrays,
+    sorted by (profile, start) and scanned with a grouped running maximum, so
+    the cost is a single sort regardless of how many profiles are analyzed.
+
+    Args:
+        profiles: Parsed resumes, as ResumeProcessing models or state dicts
+        today: Date used to close ongoing ("Present") roles; defaults to today
+
+    Returns:
+        One JSON-serializable summary dict per profile, in input order, with
+        roles, gaps, overlaps, total_months, skill_years and unparsed entries
+    """
+    today_month = np.datetime64(today or date.today(), "M").astype(np.int64)
+    profiles = [_as_dict(p) for p in profiles]
+
+    summaries = []
+    pids, starts, ends, start_slack, end_slack, labels, texts = [], [], [], [], [], [], []
+    for pid, profile in enumerate(profiles):
+        unparsed = []
+        for job in profile.get("work_history") or []:
+            if not isinstance(job, dict):
+                continue
+            label = f"{job.get('title', 'N/A')} at {job.get('company', 'N/A')}"
+            rng = parse_date_range(job.get("dates"))
+            if rng is None or rng.start is None:
+                unparsed.append(f"{label} ({job.get('dates') or 'no dates'})")
+                continue
+            start = np.datetime64(rng.start, "M").astype(np.int64)
+            if rng.is_current:
+                end = today_month
+            elif rng.end is not None:
+                end = np.datetime64(rng.end, "M").astype(np.int64)
+            else:
+                end = start
+            pids.append(pid)
+            starts.append(start)
+            ends.append(max(start, end))
+            start_slack.append(rng.start_precision - 1)
+            end_slack.append(0 if rng.is_current else rng.end_precision - 1)
+            labels.append(label)
+            texts.append(f"{job.get('title') or ''} {job.get('description') or ''}".lower())
+        summaries.append({
+            "name": profile.get("name"),
+            "roles": [],
+            "gaps": [],
+            "overlaps": [],
+            "total_months": 0,
+            "skill_years": {},
+            "unparsed": unparsed,
+        })
+
+    if not pids:
+        return summaries
+
+    pids = np.asarray(pids, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    order = np.lexsort((starts, pids))
+    pids, starts, ends = pids[order], starts[order], ends[order]
+    start_slack = np.asarray(start_slack, dtype=np.int64)[order]
+    end_slack = np.asarray(end_slack, dtype=np.int64)[order]
+    labels = [labels[i] for i in order]
+    texts = [texts[i] for i in order]
+    tenure = ends - starts + 1
+
+    # Grouped running max of end dates: offsetting each profile by a large
+    # constant keeps np.maximum.accumulate from leaking across profiles.
+    offset = pids * (int(ends.max() - starts.min()) + 1)
+    keyed_ends = ends + offset
+    running_end = np.maximum.accumulate(keyed_ends)
+    positions = np.arange(len(pids))
+    running_holder = np.maximum.accumulate(np.where(keyed_ends == running_end, positions, 0))
+    running_end -= offset
+
+    first_in_group = np.ones(len(pids), dtype=bool)
+    first_in_group[1:] = pids[1:] != pids[:-1]
+    prev_end = np.empty_like(running_end)
+    prev_end[1:] = running_end[:-1]
+    prev_end[first_in_group] = starts[first_in_group] - 1
+    prev_holder = np.empty_like(running_holder)
+    prev_holder[0] = 0
+    prev_holder[1:] = running_holder[:-1]
+
+    gap_months = starts - prev_end - 1
+    # Coarse endpoints ("2019") are widened to their earliest start and latest
+    # end, so gaps are already the smallest the dates allow but overlaps are
+    # the largest. Shrink overlaps by the months each boundary could move, so
+    # "2015 - 2019" then "2019 - Present" isn't reported as a 12-month overlap.
+    # The overlap ends at whichever end date is earlier; only that one's slack applies.
+    overlap_end_slack = np.where(prev_end <= ends, end_slack[prev_holder], end_slack)
+    overlap_months = np.minimum(prev_end, ends) - starts + 1 - start_slack - overlap_end_slack
+    covered = np.clip(ends - np.maximum(starts, prev_end + 1) + 1, 0, None)
+    total_months = np.bincount(pids, weights=covered, minlength=len(profiles)).astype(np.int64)
+
+    for i in range(len(pids)):
+        summary = summaries[pids[i]]
+        summary["roles"].append({
+            "role": labels[i],
+            "start": _month_label(starts[i]),
+            "end": _month_label(ends[i]),
+            "months": int(tenure[i]),
+        })
+        if first_in_group[i]:
+            continue
+        if gap_months[i] >= MIN_GAP_MONTHS:
+            summary["gaps"].append({
+                "after": labels[prev_holder[i]],
+                "before": labels[i],
+                "start": _month_label(prev_end[i] + 1),
+                "end": _month_label(starts[i] - 1),
+                "months": int(gap_months[i]),
+            })
+        elif overlap_months[i] >= MIN_OVERLAP_MONTHS:
+            summary["overlaps"].append({
+                "roles": [labels[prev_holder[i]], labels[i]],
+                "months": int(overlap_months[i]),
+            })
+
+    # Years per skill: union of months covered by the roles mentioning it
+    for group in np.split(positions, np.flatnonzero(first_in_group)[1:]):
+        pid = pids[group[0]]
+        summary = summaries[pid]
+        summary["total_months"] = int(total_months[pid])
+        skills = profiles[pid].get("skills") or []
+        if not skills:
+            continue
+        months = np.arange(starts[group].min(), ends[group].max() + 1)
+        coverage = (months >= starts[group, None]) & (months <= ends[group, None])
+        mentioned = np.array([[mentions(skill, texts[i]) for i in group] for skill in skills])
+        skill_months = ((mentioned.astype(np.int64) @ coverage.astype(np.int64)) > 0).sum(axis=1)
+        summary["skill_years"] = {
+            skill: round(float(m) / 12, 1) for skill, m in zip(skills, skill_months) if m
+        }
+
+    return summaries
+
+
+def analyze_timeline(profile: ResumeProcessing | dict, today: date | None = None) -> dict:
+    """Compute timeline analytics for a single profile (see analyze_timelines)."""
+    return analyze_timelines([profile], today=today)[0]
+
+
+def format_timeline(summary: dict) -> str:
+    """Format a timeline summary as readable text for LLM context."""
+    parts = []
+
+    if summary["roles"]:
+        years = summary["total_months"] / 12
+        parts.append(f"Total tenure: {years:.1f} years across {len(summary['roles'])} dated roles")
+        for role in summary["roles"]:
+            parts.append(f"- {role['role']}: {role['start']} to {role['end']} ({role['months']} months)")
+
+    if summary["gaps"]:
+        parts.append("Employment gaps:")
+        for gap in summary["gaps"]:
+            parts.append(f"- {gap['months']} months ({gap['start']} to {gap['end']}) between {gap['after']} and {gap['before']}")
+
+    if summary["overlaps"]:
+        parts.append("Overlapping roles:")
+        for overlap in summary["overlaps"]:
+            parts.append(f"- {overlap['roles'][0]} and {overlap['roles'][1]} overlap by {overlap['months']} months")
+
+    if summary["skill_years"]:
+        ranked = sorted(summary["skill_years"].items(), key=lambda item: item[1], reverse=True)[:10]
+        parts.append("Years per skill (from roles mentioning it): " + ", ".join(f"{s} {y}y" for s, y in ranked))
+
+    if summary["unparsed"]:
+        parts.append("Roles with unrecognized dates: " + "; ".join(summary["unparsed"]))
+
+    return "\n".join(parts)
@@ -0,0 +1,144 @@
+"""Tests for recording and replaying runs with cassettes."""
+
+import asyncio
+import gzip
+import json
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+from resume_builder.config import USER_ID
+from resume_builder.utils import run_session
+from resume_builder.utils.cassette import CassetteDivergenceError
+
+
+def function_call(name, **args):
+    return LlmResponse(content=types.Content(role="model", parts=[
+        types.Part(function_call=types.FunctionCall(name=name, args=args))
+    ]))
+
+
+def text(value):
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=value)]))
+
+
+class ScriptedLlm(BaseLlm):
+    """Model that plays back a fixed list of responses, or raises when it runs out."""
+    model: str = "scripted"
+    script: list = []
+    calls: int = 0
+
+    async def generate_content_async(self, llm_request, stream=False) -> AsyncGenerator[LlmResponse, None]:
+        if self.calls >= len(self.script):
+            raise RuntimeError("model called beyond its script")
+        response = self.script[self.calls]
+        self.calls += 1
+        if isinstance(response, Exception):
+            raise response
+        yield response
+
+
+tool_runs = []
+
+
+def update_job_history(tool_context: ToolContext, field: str, value: str) -> str:
+    """Update a job history field."""
+    tool_runs.append(field)
+    tool_context.state["job_history"] = {field: value}
+    return "updated"
+
+
+def make_runner(root_script, worker_script):
+    worker = LlmAgent(
+        name="worker",
+        model=ScriptedLlm(script=worker_script),
+        instruction="Record job history.",
+        tools=[update_job_history],
+    )
+    root = LlmAgent(name="root", model=ScriptedLlm(script=root_script), instruction="Route.", sub_agents=[worker])
+    return Runner(agent=root, app_name="cassette_test", session_service=InMemorySessionService())
+
+
+def live_runner():
+    return make_runner(
+        [function_call("transfer_to_agent", agent_name="worker")],
+        [function_call("update_job_history", field="name", value="Ada"), text("Saved.")],
+    )
+
+
+def offline_runner():
+    # Any model call during replay fails the run
+    return make_runner([], [])
+
+
+def run(runner, queries, path, session_name, **kwargs):
+    plugin = asyncio.run(run_session(
+        runner, runner.session_service, queries, session_name=session_name, cassette_path=str(path), **kwargs
+    ))
+    session = asyncio.run(runner.session_service.get_session(
+        app_name=runner.app_name, user_id=USER_ID, session_id=session_name
+    ))
+    return plugin, session
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    path = tmp_path / "cassettes" / "run.json.gz"
+    run(live_runner(), ["My name is Ada."], path, "record")
+    tool_runs.clear()
+    return path
+
+
+def test_replay_round_trip_without_model_or_tool_calls(cassette_path):
+    plugin, session = run(offline_runner(), ["My name is Ada."], cassette_path, "replay-ok", replay=True)
+
+    assert plugin.divergences == []
+    assert plugin.report().startswith("Replayed 3 model calls and 2 tool calls")
+    # The tool didn't run, but its state delta was applied from the cassette
+    assert tool_runs == []
+    assert session.state["job_history"] == {"name": "Ada"}
+
+
+def test_changed_query_is_flagged(cassette_path):
+    plugin, _ = run(offline_runner(), ["My name is Grace."], cassette_path, "replay-changed", replay=True)
+
+    assert plugin.divergences
+    assert "My name is Grace." in plugin.divergences[0]
+
+
+def test_strict_replay_raises_on_divergence(cassette_path):
+    with pytest.raises(CassetteDivergenceError):
+        run(offline_runner(), ["My name is Grace."], cassette_path, "replay-strict", replay=True, strict_replay=True)
+
+
+def test_running_out_of_interactions_raises(cassette_path):
+    with pytest.raises(CassetteDivergenceError, match="no more recorded model interactions"):
+        run(offline_runner(), ["My name is Ada.", "And I live in Paris."], cassette_path, "replay-long", replay=True)
+
+
+def test_failed_recording_keeps_the_previous_cassette(cassette_path):
+    before = cassette_path.read_bytes()
+    failing = make_runner([RuntimeError("quota exceeded")], [])
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        run(failing, ["My name is Ada."], cassette_path, "record-failed")
+    assert cassette_path.read_bytes() == before
+
+
+def test_model_call_without_response_is_a_divergence(cassette_path):
+    with gzip.open(cassette_path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    first_model = next(i for i in data["interactions"] if i["kind"] == "model")
+    del first_model["response"]
+    with gzip.open(cassette_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    with pytest.raises(CassetteDivergenceError, match="has no response"):
+        run(offline_runner(), ["My name is Ada."], cassette_path, "replay-truncated", replay=True)
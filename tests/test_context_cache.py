@@ -0,0 +1,87 @@
+"""Tests for context cache configuration and cache usage reporting."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.apps.app import App
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from resume_builder.config import CONTEXT_CACHE_INTERVALS, CONTEXT_CACHE_TTL_SECONDS, USER_ID
+from resume_builder.utils import CacheUsagePlugin, create_context_cache_config
+
+
+def reply(prompt_tokens, cached_tokens=None, partial=None):
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text="ok")]),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens, cached_content_token_count=cached_tokens
+        ),
+        partial=partial,
+    )
+
+
+class UsageLlm(BaseLlm):
+    """Model that reports a cached prefix on every request after the first."""
+    model: str = "usage"
+    cache_configs: list = []
+
+    async def generate_content_async(self, llm_request, stream=False) -> AsyncGenerator[LlmResponse, None]:
+        self.cache_configs.append(llm_request.cache_config)
+        yield reply(3000, 2500 if len(self.cache_configs) > 1 else None)
+
+
+def test_config_uses_settings():
+    config = create_context_cache_config()
+
+    assert config.ttl_seconds == CONTEXT_CACHE_TTL_SECONDS
+    assert config.cache_intervals == CONTEXT_CACHE_INTERVALS
+
+
+def test_plugin_reports_cached_tokens_from_usage_metadata():
+    model = UsageLlm()
+    usage = CacheUsagePlugin()
+    app = App(
+        name="cache_test",
+        root_agent=LlmAgent(name="interviewer", model=model, instruction="Interview."),
+        context_cache_config=create_context_cache_config(),
+        plugins=[usage],
+    )
+    runner = Runner(app=app, session_service=InMemorySessionService())
+
+    async def run():
+        session = await runner.session_service.create_session(app_name="cache_test", user_id=USER_ID)
+        for text in ("Hi", "More"):
+            message = types.Content(role="user", parts=[types.Part(text=text)])
+            async for _ in runner.run_async(user_id=USER_ID, session_id=session.id, new_message=message):
+                pass
+
+    asyncio.run(run())
+
+    # The App's cache config reaches every model request
+    assert model.cache_configs == [app.context_cache_config] * 2
+    report = usage.report()
+    assert (report["requests"], report["cached_requests"]) == (2, 1)
+    assert (report["prompt_tokens"], report["cached_tokens"]) == (6000, 2500)
+    assert report["cached_share"] == round(2500 / 6000, 3)
+    assert report["agents"]["interviewer"]["cached_tokens"] == 2500
+
+
+def test_partial_and_usage_free_responses_are_ignored():
+    usage = CacheUsagePlugin()
+    context = SimpleNamespace(agent_name="coordinator")
+
+    async def run():
+        await usage.after_model_callback(callback_context=context, llm_response=reply(100, 80, partial=True))
+        await usage.after_model_callback(callback_context=context, llm_response=LlmResponse())
+        await usage.after_model_callback(callback_context=context, llm_response=reply(100))
+
+    asyncio.run(run())
+
+    report = usage.report()
+    assert (report["requests"], report["cached_tokens"], report["cached_share"]) == (1, 0, 0.0)
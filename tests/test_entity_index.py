@@ -0,0 +1,105 @@
+"""Tests for the cross-candidate entity resolution index."""
+
+import random
+
+import pytest
+
+from resume_builder.utils import entity_index
+from resume_builder.utils.entity_index import EntityIndex
+
+
+@pytest.fixture
+def index():
+    idx = EntityIndex(":memory:")
+    yield idx
+    idx.close()
+
+
+def test_spelling_variants_resolve_to_one_entity(index):
+    google = index.resolve("Google LLC", "company")
+    for variant in ["Google", "Google Inc.", "Googel", "Gogle", "Goolge Inc"]:
+        assert index.resolve(variant, "company") == google, variant
+
+    microsoft = index.resolve("Microsoft", "company")
+    assert index.resolve("Mircosoft", "company") == microsoft
+    assert index.resolve("Microsoft Corporation", "company") == microsoft
+
+
+def test_acronyms_and_distinct_institutions(index):
+    mit = index.resolve("Massachusetts Institute of Technology", "institution")
+    assert index.resolve("MIT", "institution") == mit
+
+    uw = index.resolve("University of Washington", "institution")
+    assert index.resolve("Univ. of Washington", "institution") == uw
+    assert index.resolve("Washington State University", "institution") != uw
+
+
+def test_word_order_of_generic_tokens_matters(index):
+    uw = index.resolve("University of Washington", "institution")
+    miami = index.resolve("University of Miami", "institution")
+
+    assert index.resolve("Washington University", "institution") != uw
+    assert index.resolve("Miami University", "institution") != miami
+    assert index.resolve("Univ of Miami", "institution") == miami
+
+
+def test_acronym_aliases_do_not_bridge_entities(index):
+    ge = index.resolve("General Electric", "company")
+    assert index.resolve("GE", "company") == ge
+
+    global_energy = index.resolve("Global Energy", "company")
+    assert global_energy != ge
+    # Stored acronym alias still resolves exactly
+    assert index.resolve("GE", "company") == ge
+
+
+def test_ambiguous_acronym_stays_unresolved(index):
+    general_electric = index.resolve("General Electric", "company")
+    global_energy = index.resolve("Global Energy", "company")
+
+    assert index.lookup("GE", "company") not in (general_electric, global_energy)
+
+
+def test_candidates_stay_bounded_as_index_grows(index, monkeypatch):
+    # Cheap inserts; the candidate count below is measured without the cut
+    monkeypatch.setattr(entity_index, "MAX_CANDIDATES", 20)
+    rng = random.Random(0)
+    syllables = ["ka", "lo", "mi", "ra", "ten", "vo", "shi", "nu", "bel", "dor"]
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 3)))
+
+    probe = entity_index.normalize_name("Kalomi Tenvo")
+    bound = len(entity_index.blocking_keys(probe)) * entity_index.MAX_BLOCK_SIZE
+    # Check twice as the index grows
+    for _ in range(2):
+        for _ in range(800):
+            index.resolve(f"{word().title()} {word().title()} Labs", "company")
+        size = index._conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0]
+        # Count every candidate, not just those that survive the ranking cut
+        with monkeypatch.context() as m:
+            m.setattr(entity_index, "MAX_CANDIDATES", size)
+            assert len(index._candidates("company", probe)) <= bound < size
+
+
+def test_match_survives_large_blocks(index, monkeypatch):
+    monkeypatch.setattr(entity_index, "MAX_CANDIDATES", 20)
+    # Distractors share every trigram and token of the target, so those blocks are skipped
+    for i in range(100):
+        index.resolve(f"Zephyr Bank Branch {i:03d}", "company")
+    target = index.resolve("Zephyr Bank", "company")
+
+    assert index.resolve("Zephyr Bnak", "company") == target
+
+
+def test_candidates_for_entity(index):
+    index.ingest_profile("c1", {"work_history": [{"company": "Google"}], "education": [{"institution": "MIT"}]})
+    index.ingest_profile("c2", {"work_history": [{"company": "Google, Inc"}]})
+    index.ingest_profile("c3", {"volunteering": [{"company": "Google"}]})
+
+    assert index.candidates_for("google llc") == ["c1", "c2", "c3"]
+    assert index.candidates_for("Google", field="work_history") == ["c1", "c2"]
+
+    # Re-ingesting replaces a candidate's previous mentions
+    index.ingest_profile("c2", {"work_history": [{"company": "Microsoft"}]})
+    assert index.candidates_for("Google", field="work_history") == ["c1"]
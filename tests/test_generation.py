@@ -0,0 +1,132 @@
+"""Tests for batched tailored-resume generation and rendering."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from resume_builder.generation import ResumeGenerator, render_markdown, render_pdf
+from resume_builder.models import Education, JobHistory, JobListing, ResumeProcessing
+
+
+def make_profile():
+    return ResumeProcessing(
+        name="Test Candidate",
+        phone="555-0100",
+        address="Seattle, WA",
+        introduction="Backend engineer.",
+        skills=["Python", "SQL", "Go"],
+        work_history=[
+            JobHistory(title="Engineer", company="Acme", dates="2019 - Present",
+                       description="Built data pipelines in Python and SQL."),
+            JobHistory(title="Intern", company="Foo", dates="Summer 2018"),
+        ],
+        education=[Education(institution="University of Washington", dates="2014-2018", field_of_study="CS")],
+    )
+
+
+async def fake_generate(prompt):
+    await asyncio.sleep(0)
+    return "- " + prompt.splitlines()[-1]
+
+
+def generate(listings, generator=None):
+    generator = generator or ResumeGenerator(generate=fake_generate, max_concurrency=2)
+    return asyncio.run(generator.generate(make_profile(), listings))
+
+
+def test_fragments_are_shared_within_a_cluster():
+    listings = [JobListing(title="Python developer", company=c, description="Python and SQL") for c in "abc"]
+    listings.append(JobListing(title="Go developer", company="d", description="Go services at Google scale"))
+
+    resumes, report = generate(listings)
+
+    assert report.clusters == 2
+    # One introduction and one bullet fragment (only Acme has a description) per cluster
+    assert report.llm_calls == 4
+    assert report.baseline_llm_calls == 4 and report.llm_calls_avoided == 0
+    assert resumes[3].skills[0] == "Go"
+    assert resumes[0].experience[1].bullets == []
+
+
+def test_role_bullets_are_shared_across_clusters():
+    profile = ResumeProcessing(
+        name="Test Candidate",
+        phone="555-0100",
+        address="Seattle, WA",
+        skills=["Python", "SQL", "Go", "AWS", "Docker", "Kafka"],
+        work_history=[
+            JobHistory(title="Engineer", company="A", dates="2020 - Present", description="Built APIs in Python."),
+            JobHistory(title="Analyst", company="B", dates="2018 - 2020", description="SQL reporting."),
+            JobHistory(title="Developer", company="C", dates="2016 - 2018", description="Go services on AWS."),
+        ],
+    )
+    # Every listing asks for a different three-skill stack
+    stacks = [list(stack) for stack in itertools.combinations(profile.skills, 3)]
+    listings = [JobListing(title="Engineer", company=f"co{i}", description=", ".join(stack), skills=stack)
+                for i, stack in enumerate(stacks)]
+
+    generator = ResumeGenerator(generate=fake_generate)
+    resumes, report = asyncio.run(generator.generate(profile, listings))
+
+    assert report.clusters == len(stacks) == 20
+    # Bullets depend only on which of a role's skills a listing asks for (2 + 2 + 4 variants);
+    # introductions only on the top two matched skills
+    assert report.llm_calls == 8 + 10 < report.baseline_llm_calls
+    assert report.llm_calls_avoided == report.baseline_llm_calls - report.llm_calls
+    # Different clusters, same emphasis for the Python role
+    assert resumes[0].cluster != resumes[1].cluster
+    assert resumes[0].experience[0].bullets == resumes[1].experience[0].bullets
+    assert resumes[0].experience[0].bullets[0].endswith(": Python")
+
+
+def test_generator_can_be_reused_across_event_loops():
+    generator = ResumeGenerator(generate=fake_generate, max_concurrency=2)
+    listings = [JobListing(title="Python developer", company="a", description="Python and SQL")]
+
+    first, _ = generate(listings, generator)
+    again, report = generate(listings, generator)
+    assert report.llm_calls == 0 and report.llm_calls_avoided == 1
+    assert again[0].experience[0].bullets == first[0].experience[0].bullets
+
+    _, report = generate([JobListing(title="Go developer", company="d", description="Go")], generator)
+    assert report.llm_calls == 2
+
+
+def test_failed_fragments_are_retried_on_the_next_call():
+    failures = {"left": 1}
+
+    async def flaky_generate(prompt):
+        if "bullets" in prompt and failures["left"]:
+            failures["left"] -= 1
+            raise RuntimeError("rate limited")
+        return await fake_generate(prompt)
+
+    generator = ResumeGenerator(generate=flaky_generate)
+    listings = [JobListing(title="Python developer", company="a", description="Python")]
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        generate(listings, generator)
+    _, report = generate(listings, generator)
+    # Only the failed bullets fragment is regenerated; the introduction was kept
+    assert report.llm_calls == 1
+
+
+def test_render_markdown_contains_sections():
+    resumes, _ = generate([JobListing(title="Python developer", company="a", description="Python")])
+    markdown = render_markdown(resumes[0])
+
+    assert markdown.startswith("# Test Candidate\n")
+    assert "## Skills\nPython, SQL, Go" in markdown
+    assert "### Engineer - Acme" in markdown
+    assert "- University of Washington, CS (2014-2018)" in markdown
+
+
+def test_render_pdf_writes_file(tmp_path):
+    pytest.importorskip("fpdf")
+    resumes, _ = generate([JobListing(title="Python developer", company="a", description="Python")])
+
+    path = render_pdf(resumes[0], str(tmp_path / "resume.pdf"))
+
+    with open(path, "rb") as f:
+        assert f.read(5) == b"%PDF-"
@@ -0,0 +1,107 @@
+"""Tests for date range parsing and timeline analytics."""
+
+from datetime import date
+
+from resume_builder.models import JobHistory, ResumeProcessing, parse_date_range
+from resume_builder.utils.timeline import analyze_timeline, analyze_timelines
+
+
+def make_profile(jobs, skills=None):
+    return ResumeProcessing(
+        name="Test Candidate",
+        phone="555-0100",
+        address="Seattle, WA",
+        work_history=[JobHistory(**job) for job in jobs],
+        skills=skills,
+    )
+
+
+def test_parse_date_range_formats():
+    current = parse_date_range("Jan 2019 – Present")
+    assert current.start == date(2019, 1, 1) and current.end is None and current.is_current
+
+    years = parse_date_range("2015-2017")
+    assert (years.start, years.end) == (date(2015, 1, 1), date(2017, 12, 1))
+
+    season = parse_date_range("Summer 2020")
+    assert (season.start, season.end) == (date(2020, 6, 1), date(2020, 8, 1))
+
+    assert parse_date_range("sometime") is None
+
+
+def test_parse_date_range_precision_and_compact_formats():
+    years = parse_date_range("2015 - 2019")
+    assert (years.start_precision, years.end_precision) == (12, 12)
+    assert parse_date_range("Summer 2020").start_precision == 3
+
+    dotted = parse_date_range("03.2018 - 05.2019")
+    assert (dotted.start, dotted.end) == (date(2018, 3, 1), date(2019, 5, 1))
+    assert (dotted.start_precision, dotted.end_precision) == (1, 1)
+
+    short = parse_date_range("Jan '19 - Present")
+    assert short.start == date(2019, 1, 1) and short.is_current
+
+
+def test_gaps_overlaps_and_tenure():
+    profile = make_profile([
+        {"title": "Analyst", "company": "Bar", "dates": "2015-2017"},
+        {"title": "Consultant", "company": "Baz", "dates": "06/2018 - 08/2019"},
+        {"title": "Engineer", "company": "Acme", "dates": "Jan 2019 – Present"},
+    ])
+    summary = analyze_timeline(profile, today=date(2020, 12, 1))
+
+    assert [gap["months"] for gap in summary["gaps"]] == [5]
+    assert summary["overlaps"] == [{"roles": ["Consultant at Baz", "Engineer at Acme"], "months": 8}]
+    # 36 + 15 + 24 months, minus the 8 overlapping ones
+    assert summary["total_months"] == 67
+
+
+def test_shared_year_boundary_is_not_an_overlap():
+    profile = make_profile([
+        {"title": "Analyst", "company": "A", "dates": "2015 - 2019"},
+        {"title": "Engineer", "company": "B", "dates": "2019 - Present"},
+    ])
+    summary = analyze_timeline(profile, today=date(2022, 12, 1))
+
+    assert summary["overlaps"] == [] and summary["gaps"] == []
+    assert summary["total_months"] == 96
+
+
+def test_year_only_overlap_reports_only_the_certain_months():
+    profile = make_profile([
+        {"title": "Analyst", "company": "A", "dates": "2015 - 2019"},
+        {"title": "Engineer", "company": "B", "dates": "Jan 2019 - Present"},
+        {"title": "Advisor", "company": "C", "dates": "2017 - 2018"},
+    ])
+    summary = analyze_timeline(profile, today=date(2022, 12, 1))
+
+    # Advisor lies inside Analyst but may only run Dec 2017 - Jan 2018; Engineer
+    # starting Jan 2019 is only certain to share that month with a role ending "2019"
+    assert summary["overlaps"] == [{"roles": ["Analyst at A", "Advisor at C"], "months": 2}]
+
+
+def test_skill_years_use_whole_word_matches():
+    profile = make_profile(
+        [
+            {"title": "Engineer", "company": "Acme", "dates": "2019-2020",
+             "description": "Good consulting work in Python"},
+            {"title": "Developer", "company": "Foo", "dates": "2021", "description": "Built services in Go and R"},
+        ],
+        skills=["Python", "Go", "R", "C"],
+    )
+    summary = analyze_timeline(profile)
+
+    assert summary["skill_years"] == {"Python": 2.0, "Go": 1.0, "R": 1.0}
+
+
+def test_many_profiles_are_independent():
+    first = make_profile([{"title": "A", "company": "X", "dates": "2010 - 2012"}])
+    second = {"name": "Dict Profile", "work_history": [
+        {"title": "B", "company": "Y", "dates": "2010"},
+        {"title": "C", "company": "Z", "dates": "2014"},
+    ]}
+    summaries = analyze_timelines([first, {}, second])
+
+    assert summaries[0]["total_months"] == 36 and not summaries[0]["gaps"]
+    assert summaries[1]["roles"] == []
+    assert [gap["months"] for gap in summaries[2]["gaps"]] == [36]